@@ -1,8 +1,4 @@
-from gitx.main import app
-
-
-def main() -> None:
-    app()
+from gitx.main import main
 
 
 if __name__ == "__main__":  # pragma: no cover - module entry
@@ -1,32 +1,48 @@
-import shutil
-import subprocess
+from __future__ import annotations
+
+import functools
+import importlib
+import os
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 import typer
-from rich.console import Console
-from rich.pretty import pprint
-from rich.table import Table
-from rich.panel import Panel
 
-from .config import RepoConfig, get_config_path, show_config, _config, resolve_editor
-from .helpers import git
-from .helpers.update import maybe_check_for_update
+from .console import get_console
+
+if TYPE_CHECKING:
+    from .config import RepoConfig
+
+
+# --install-completion/--show-completion are only registered when asked for,
+# either through GITX_ENABLE_COMPLETION=1 or an installed completion script;
+# `gitx completion <action>` builds its own completion-enabled app.
+_COMPLETION_FLAGS = {
+    "install": "--install-completion",
+    "show": "--show-completion",
+}
+
 
-console = Console()
+def _completion_requested() -> bool:
+    """True when an installed completion script runs us (_GITX_COMPLETE=...)."""
+    return any(key.startswith("_") and key.endswith("_COMPLETE") for key in os.environ)
 
-app = typer.Typer(add_completion=True)
 
-config = typer.Typer(no_args_is_help=True)
-branch = typer.Typer(no_args_is_help=True)
+# Commands are registered here; build_app() assembles the runnable app.
+_app = typer.Typer()
 
-app.add_typer(config, name="config")
-app.add_typer(branch, name="branch")
+# Sub-apps are imported on demand, see build_app().
+_SUBAPPS = {
+    "config": "cli_config",
+    "branch": "cli_branch",
+}
 
 
-@app.callback(invoke_without_command=True)
+@_app.callback(invoke_without_command=True)
 def main_callback(ctx: typer.Context) -> None:
-    maybe_check_for_update(console)
+    from .helpers.update import maybe_check_for_update
+
+    maybe_check_for_update(get_console())
 
 
 # ===========================================================================
@@ -38,7 +54,12 @@ def resolve_worktree(
     branch: Optional[str],
     *,
     interactive: bool = True,
+    checkout: bool = True,
 ) -> Path:
+    from .config import _config
+    from .helpers import git
+    from .helpers.cli import confirm
+
     if branch is None:
         branch = repo_cfg.lastBranch or repo_cfg.defaultBranch
 
@@ -51,7 +72,7 @@ def resolve_worktree(
         raise RuntimeError("Worktree does not exist")
 
     if not git.branch_exists(repo_cfg.main_git_path(), branch):
-        create_branch = typer.confirm(
+        create_branch = confirm(
             f"Branch '{branch}' does not exist. Create it from current HEAD?",
             default=False,
         )
@@ -63,14 +84,14 @@ def resolve_worktree(
         except git.GitCommandFailed as exc:
             raise RuntimeError(f"Failed to create branch '{branch}': {exc}") from exc
 
-    create_worktree = typer.confirm(
+    create_worktree = confirm(
         f"Worktree for branch '{branch}' does not exist. Create it?",
         default=True,
     )
     if not create_worktree:
         raise RuntimeError("Worktree does not exist")
 
-    git.add_worktree(repo_cfg, branch)
+    git.add_worktree(repo_cfg, branch, checkout=checkout)
 
     repo_cfg.lastBranch = branch
     _config.save()
@@ -82,12 +103,24 @@ def resolve_worktree(
 # go
 # ===========================================================================
 
-@app.command()
-def go(repo: str, branch: Optional[str] = None) -> None:
+@_app.command()
+def go(
+    repo: str,
+    branch: Optional[str] = None,
+    checkout: bool = typer.Option(
+        True,
+        "--checkout/--no-checkout",
+        help="Check out files when a new worktree is created.",
+    ),
+) -> None:
+    from .config import _config
+    from .helpers import git
+    from .helpers.cli import confirm
+
     repo_cfg: RepoConfig | None = _config.resolve_workspace(repo)
 
     if repo_cfg is None:
-        clone_repo = typer.confirm(
+        clone_repo = confirm(
             f"Repository '{repo}' does not exist. Clone it?",
             default=True,
         )
@@ -97,19 +130,19 @@ def go(repo: str, branch: Optional[str] = None) -> None:
         try:
             repo_cfg = git.clone_and_add_worktree(repo)
         except Exception as exc:  # GitCommandFailed, GitxError, etc.
-            console.print(f"[red]{exc}[/]")
+            get_console().print(f"[red]{exc}[/]")
             raise typer.Exit(code=1)
 
         _config.workspaces.update({repo: repo_cfg})
         _config.save()
 
     try:
-        path = resolve_worktree(repo_cfg, branch)
+        path = resolve_worktree(repo_cfg, branch, checkout=checkout)
     except RuntimeError as exc:
-        console.print(f"[red]{exc}[/]")
+        get_console().print(f"[red]{exc}[/]")
         raise typer.Exit(code=1)
 
-    print(str(path))
+    print(path)
     raise typer.Exit(code=0)
 
 
@@ -117,12 +150,16 @@ def go(repo: str, branch: Optional[str] = None) -> None:
 # code
 # ===========================================================================
 
-@app.command()
+@_app.command()
 def code(repo: str, branch: Optional[str] = None) -> None:
+    from .config import _config, resolve_editor
+    from .helpers import git
+    from .helpers.cli import confirm, launch
+
     repo_cfg: RepoConfig | None = _config.resolve_workspace(repo)
 
     if repo_cfg is None:
-        clone_repo = typer.confirm(
+        clone_repo = confirm(
             f"Repository '{repo}' does not exist. Clone it?",
             default=True,
         )
@@ -132,7 +169,7 @@ def code(repo: str, branch: Optional[str] = None) -> None:
         try:
             repo_cfg = git.clone_and_add_worktree(repo)
         except Exception as exc:  # GitCommandFailed, GitxError, etc.
-            console.print(f"[red]{exc}[/]")
+            get_console().print(f"[red]{exc}[/]")
             raise typer.Exit(code=1)
 
         _config.workspaces.update({repo: repo_cfg})
@@ -141,16 +178,12 @@ def code(repo: str, branch: Optional[str] = None) -> None:
     try:
         path = resolve_worktree(repo_cfg, branch)
     except RuntimeError as exc:
-        console.print(f"[red]{exc}[/]")
+        get_console().print(f"[red]{exc}[/]")
         raise typer.Exit(code=1)
 
-    subprocess.run(
-        [resolve_editor(_config.globals.editor), str(path)],
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-    )
+    launch(resolve_editor(_config.globals.editor), path)
 
-    print(str(path))
+    print(path)
     raise typer.Exit(code=0)
 
 
@@ -158,12 +191,16 @@ def code(repo: str, branch: Optional[str] = None) -> None:
 # explore
 # ===========================================================================
 
-@app.command()
+@_app.command()
 def explore(repo: str, branch: Optional[str] = None) -> None:
+    from .config import _config
+    from .helpers import git
+    from .helpers.cli import confirm, launch
+
     repo_cfg: RepoConfig | None = _config.resolve_workspace(repo)
 
     if repo_cfg is None:
-        clone_repo = typer.confirm(
+        clone_repo = confirm(
             f"Repository '{repo}' does not exist. Clone it?",
             default=True,
         )
@@ -172,8 +209,8 @@ def explore(repo: str, branch: Optional[str] = None) -> None:
 
         try:
             repo_cfg = git.clone_and_add_worktree(repo)
-        except GitCommandFailed as exc:
-            console.print(f"[red]{exc}[/]")
+        except git.GitCommandFailed as exc:
+            get_console().print(f"[red]{exc}[/]")
             raise typer.Exit(code=1)
 
         _config.workspaces.update({repo: repo_cfg})
@@ -182,16 +219,12 @@ def explore(repo: str, branch: Optional[str] = None) -> None:
     try:
         path = resolve_worktree(repo_cfg, branch)
     except RuntimeError as exc:
-        console.print(f"[red]{exc}[/]")
+        get_console().print(f"[red]{exc}[/]")
         raise typer.Exit(code=1)
 
-    subprocess.run(
-        ["xdg-open", str(path)],
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-    )
+    launch("xdg-open", path)
 
-    print(str(path))
+    print(path)
     raise typer.Exit(code=0)
 
 
@@ -199,12 +232,17 @@ def explore(repo: str, branch: Optional[str] = None) -> None:
 # clone
 # ===========================================================================
 
-@app.command()
+@_app.command()
 def clone(repo: str) -> None:
+    from rich.panel import Panel
+
+    from .config import _config
+    from .helpers import git
+
     repo_cfg: RepoConfig | None = _config.resolve_workspace(repo)
 
     if repo_cfg is not None:
-        console.print(
+        get_console().print(
             Panel.fit(
                 f"[yellow]Repository already exists.[/] {repo_cfg.main_git_path()}",
                 title="gitx clone",
@@ -215,13 +253,13 @@ def clone(repo: str) -> None:
     try:
         repo_cfg = git.clone_and_add_worktree(repo)
     except Exception as exc:  # GitCommandFailed, GitxError, etc.
-        console.print(f"[red]{exc}[/]")
+        get_console().print(f"[red]{exc}[/]")
         raise typer.Exit(code=1)
 
     _config.workspaces.update({repo: repo_cfg})
     _config.save()
 
-    console.print(
+    get_console().print(
         Panel.fit(
             f"[green]Repository ready:[/] "
             f"{repo_cfg.worktree_path_for(repo_cfg.defaultBranch)}",
@@ -236,8 +274,13 @@ def clone(repo: str) -> None:
 # delete
 # ===========================================================================
 
-@app.command()
+@_app.command()
 def delete(repo: str) -> None:
+    from rich.panel import Panel
+
+    from .config import _config
+    from .helpers.cli import remove_tree
+
     workspace_key: str | None = None
     repo_cfg: RepoConfig | None = None
 
@@ -252,23 +295,22 @@ def delete(repo: str) -> None:
                 break
 
     if repo_cfg is None or workspace_key is None:
-        console.print(f"[yellow]Repository '{repo}' is not configured.[/]")
+        get_console().print(f"[yellow]Repository '{repo}' is not configured.[/]")
         raise typer.Exit(code=1)
 
     repo_path = repo_cfg.parent_path()
-    if repo_path.exists():
-        try:
-            shutil.rmtree(repo_path)
-        except OSError as exc:
-            console.print(f"[red]Failed to delete '{repo_path}': {exc}[/]")
-            raise typer.Exit(code=1)
-    else:
-        console.print(f"[yellow]Local path '{repo_path}' does not exist. Skipping removal.[/]")
+    try:
+        remove_tree(repo_path)
+    except FileNotFoundError:
+        get_console().print(f"[yellow]Local path '{repo_path}' does not exist. Skipping removal.[/]")
+    except OSError as exc:
+        get_console().print(f"[red]Failed to delete '{repo_path}': {exc}[/]")
+        raise typer.Exit(code=1)
 
     _config.workspaces.pop(workspace_key, None)
     _config.save()
 
-    console.print(
+    get_console().print(
         Panel.fit(
             f"[green]Repository '{repo_cfg.full_name}' removed from gitx config.[/]",
             title="gitx delete",
@@ -279,136 +321,63 @@ def delete(repo: str) -> None:
 
 
 # ===========================================================================
-# config
-# ===========================================================================
-
-@config.command("set")
-def config_set(key: str, value: str) -> None:
-    _config.set_config_value(key, value)
-    raise typer.Exit(code=0)
-
-
-@config.command("get")
-def config_get(key: str) -> None:
-    console.print(_config.get_value(key))
-    raise typer.Exit(code=0)
-
-
-@config.command("show")
-def config_show() -> None:
-    pprint(show_config(), expand_all=True, console=console)
-    raise typer.Exit(code=0)
-
-
-@config.command("edit")
-def config_edit() -> None:
-    print(f"Opening config file: {_config.globals.editor} {str(get_config_path())}")
-    subprocess.run(
-        [resolve_editor(_config.globals.editor), str(get_config_path())],
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-    )
-    raise typer.Exit(code=0)
-
-
-# ===========================================================================
-# branch add
-# ===========================================================================
-
-@branch.command("add")
-def branch_add(repo: str, branch: str) -> None:
-    repo_cfg: RepoConfig | None = _config.resolve_workspace(repo)
-
-    if repo_cfg is None:
-        clone_repo = typer.confirm(
-            f"Repository '{repo}' does not exist. Clone it?",
-            default=True,
-        )
-        if not clone_repo:
-            raise typer.Exit(code=1)
-
-        if git.branch_exists(repo_cfg.repo_root_path(), branch):
-            console.print(f"[red]Branch '{branch}' already exists locally.[/]")
-            raise typer.Exit(code=0)
-
-        try:
-            repo_cfg = git.clone_and_add_worktree(repo)
-        except Exception as exc:  # GitCommandFailed, GitxError, etc.
-            console.print(f"[red]{exc}[/]")
-            raise typer.Exit(code=1)
-
-        _config.workspaces.update({repo: repo_cfg})
-        _config.save()
-
-    raise typer.Exit(code=0)
-
-
-# ===========================================================================
-# branch delete
+# completion
 # ===========================================================================
 
-@branch.command("delete")
-def branch_delete(repo: str, branch: str) -> None:
-    repo_cfg: RepoConfig | None = _config.resolve_workspace(repo)
-
-    if repo_cfg is None:
-        console.print(f"[yellow]Repository '{repo}' does not exist.[/]")
+@_app.command()
+def completion(ctx: typer.Context, action: str) -> None:
+    """Install or show shell completion (action: install | show)."""
+    flag = _COMPLETION_FLAGS.get(action)
+    if flag is None:
+        get_console().print(f"[red]Unknown completion action '{action}'. Use 'install' or 'show'.[/]")
         raise typer.Exit(code=1)
 
-    delete_remote = typer.confirm(
-        f"Also delete remote branch 'origin/{branch}'?",
-        default=False,
-    )
-
-    try:
-        git.delete_branch(repo_cfg, branch, delete_remote=delete_remote)
-    except git.BranchDoesNotExist as exc:
-        console.print(f"[red]{exc}[/]")
-        raise typer.Exit(code=1)
-    except git.GitCommandFailed as exc:
-        console.print(f"[red]{exc}[/]")
-        raise typer.Exit(code=1)
-
-    raise typer.Exit(code=0)
+    completion_app = _assemble(add_completion=True, wanted=None)
+    typer.main.get_command(completion_app).main([flag], prog_name=ctx.find_root().info_name)
 
 
 # ===========================================================================
-# branch list
+# sub-apps
 # ===========================================================================
 
-@branch.command("list")
-def branch_list(repo: str) -> None:
-    repo_cfg: RepoConfig | None = _config.resolve_workspace(repo)
-
-    if repo_cfg is None:
-        console.print(f"[yellow]Repository '{repo}' does not exist.[/]")
-        raise typer.Exit(code=1)
-
-    statuses = git.list_branches_with_status(repo_cfg)
-    if not statuses:
-        raise typer.Exit(code=0)
-
-    table = Table(title=f"Branches for {repo_cfg.main_git_path()}")
-    table.add_column("Branch")
-    table.add_column("Remote")
-    table.add_column("Local")
-    table.add_column("Status")
-
-    for s in statuses:
-        name = f"* {s.name}" if s.is_current else s.name
-        remote = s.remote or "-"
-        local = "yes" if s.has_local else "no"
-
-        if s.ahead == 0 and s.behind == 0:
-            sync = "in sync"
-        elif s.ahead > 0 and s.behind == 0:
-            sync = f"↑ {s.ahead}"
-        elif s.ahead == 0 and s.behind > 0:
-            sync = f"↓ {s.behind}"
-        else:
-            sync = f"↑ {s.ahead} / ↓ {s.behind}"
-
-        table.add_row(name, remote, local, sync)
-
-    console.print(table)
-    raise typer.Exit(code=0)
\ No newline at end of file
+def _sniff_subcommand(argv: list[str]) -> Optional[str]:
+    """Return the top-level command from argv, or None when every sub-app is needed."""
+    if _completion_requested():
+        return None
+
+    for arg in argv:
+        if arg == "--help":
+            return None
+        if not arg.startswith("-"):
+            return arg
+    return None
+
+
+@functools.cache
+def _assemble(*, add_completion: bool, wanted: Optional[str]) -> typer.Typer:
+    app = typer.Typer(add_completion=add_completion)
+    app.registered_callback = _app.registered_callback
+    app.registered_commands = list(_app.registered_commands)
+    for name, module in _SUBAPPS.items():
+        if wanted is None or wanted == name:
+            sub = importlib.import_module(f".{module}", __package__)
+            app.add_typer(sub.app, name=name)
+    return app
+
+
+def build_app(argv: Optional[list[str]] = None) -> typer.Typer:
+    """Return the runnable gitx app.
+
+    With argv (the console script passes sys.argv[1:]), only the sub-app that
+    will run is imported; without it, every group is registered.
+    """
+    wanted = None if argv is None else _sniff_subcommand(argv)
+    add_completion = os.environ.get("GITX_ENABLE_COMPLETION") == "1" or _completion_requested()
+    return _assemble(add_completion=add_completion, wanted=wanted)
+
+
+def __getattr__(name: str) -> Any:
+    # `from gitx.cli import app` always gets the complete app.
+    if name == "app":
+        return build_app()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import sys
+from typing import TYPE_CHECKING
+
+import typer
+
+from .console import get_console
+
+if TYPE_CHECKING:
+    from .config import RepoConfig
+
+app = typer.Typer(no_args_is_help=True)
+
+
+# ===========================================================================
+# branch add
+# ===========================================================================
+
+@app.command("add")
+def branch_add(repo: str, branch: str) -> None:
+    from .config import _config
+    from .helpers import git
+    from .helpers.cli import confirm
+
+    repo_cfg: RepoConfig | None = _config.resolve_workspace(repo)
+
+    if repo_cfg is None:
+        clone_repo = confirm(
+            f"Repository '{repo}' does not exist. Clone it?",
+            default=True,
+        )
+        if not clone_repo:
+            raise typer.Exit(code=1)
+
+        if git.branch_exists(repo_cfg.repo_root_path(), branch):
+            get_console().print(f"[red]Branch '{branch}' already exists locally.[/]")
+            raise typer.Exit(code=0)
+
+        try:
+            repo_cfg = git.clone_and_add_worktree(repo)
+        except Exception as exc:  # GitCommandFailed, GitxError, etc.
+            get_console().print(f"[red]{exc}[/]")
+            raise typer.Exit(code=1)
+
+        _config.workspaces.update({repo: repo_cfg})
+        _config.save()
+
+    raise typer.Exit(code=0)
+
+
+# ===========================================================================
+# branch delete
+# ===========================================================================
+
+@app.command("delete")
+def branch_delete(repo: str, branch: str) -> None:
+    from .config import _config
+    from .helpers import git
+    from .helpers.cli import confirm
+
+    repo_cfg: RepoConfig | None = _config.resolve_workspace(repo)
+
+    if repo_cfg is None:
+        get_console().print(f"[yellow]Repository '{repo}' does not exist.[/]")
+        raise typer.Exit(code=1)
+
+    delete_remote = confirm(
+        f"Also delete remote branch 'origin/{branch}'?",
+        default=False,
+    )
+
+    try:
+        git.delete_branch(repo_cfg, branch, delete_remote=delete_remote)
+    except git.BranchDoesNotExist as exc:
+        get_console().print(f"[red]{exc}[/]")
+        raise typer.Exit(code=1)
+    except git.GitCommandFailed as exc:
+        get_console().print(f"[red]{exc}[/]")
+        raise typer.Exit(code=1)
+
+    raise typer.Exit(code=0)
+
+
+# ===========================================================================
+# branch list
+# ===========================================================================
+
+@app.command("list")
+def branch_list(repo: str) -> None:
+    from .config import _config
+    from .helpers import git
+
+    repo_cfg: RepoConfig | None = _config.resolve_workspace(repo)
+
+    if repo_cfg is None:
+        get_console().print(f"[yellow]Repository '{repo}' does not exist.[/]")
+        raise typer.Exit(code=1)
+
+    statuses = git.list_branches_with_status(repo_cfg)
+    if not statuses:
+        raise typer.Exit(code=0)
+
+    rows = []
+    for s in statuses:
+        name = f"* {s.name}" if s.is_current else s.name
+        remote = s.remote or "-"
+        local = "yes" if s.has_local else "no"
+
+        if s.ahead == 0 and s.behind == 0:
+            sync = "in sync"
+        elif s.ahead > 0 and s.behind == 0:
+            sync = f"↑ {s.ahead}"
+        elif s.ahead == 0 and s.behind > 0:
+            sync = f"↓ {s.behind}"
+        else:
+            sync = f"↑ {s.ahead} / ↓ {s.behind}"
+
+        rows.append((name, remote, local, sync))
+
+    # Piped output skips Rich entirely: one tab-separated line per branch.
+    if not sys.stdout.isatty():
+        sys.stdout.write("".join("\t".join(row) + "\n" for row in rows))
+        raise typer.Exit(code=0)
+
+    from rich.table import Table
+
+    table = Table(title=f"Branches for {repo_cfg.main_git_path()}")
+    table.add_column("Branch")
+    table.add_column("Remote")
+    table.add_column("Local")
+    table.add_column("Status")
+    for row in rows:
+        table.add_row(*row)
+
+    get_console().print(table)
+    raise typer.Exit(code=0)
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import typer
+
+from .console import get_console
+
+app = typer.Typer(no_args_is_help=True)
+
+
+# ===========================================================================
+# config
+# ===========================================================================
+
+@app.command("set")
+def config_set(key: str, value: str) -> None:
+    from .config import _config
+
+    _config.set_config_value(key, value)
+    raise typer.Exit(code=0)
+
+
+@app.command("get")
+def config_get(key: str) -> None:
+    from .config import _config
+
+    get_console().print(_config.get_value(key))
+    raise typer.Exit(code=0)
+
+
+@app.command("show")
+def config_show() -> None:
+    from rich.pretty import pprint
+
+    from .config import show_config
+
+    pprint(show_config(), expand_all=True, console=get_console())
+    raise typer.Exit(code=0)
+
+
+@app.command("edit")
+def config_edit() -> None:
+    from .config import _config, get_config_path, resolve_editor
+    from .helpers.cli import launch
+
+    print(f"Opening config file: {_config.globals.editor} {get_config_path()}")
+    launch(resolve_editor(_config.globals.editor), get_config_path())
+    raise typer.Exit(code=0)
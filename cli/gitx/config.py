@@ -1,18 +1,13 @@
 import json
 import os
 from dataclasses import asdict, dataclass, field, fields, is_dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Type, TypeVar, Optional, get_origin, get_args
-
-from rich.console import Console
-
-console = Console()
+from typing import Any, Optional
 
 CONFIG_DIR_NAME = "gitx"
 CONFIG_FILE_NAME = "config.json"
 
-T = TypeVar("T")
-
 
 def _default_base_dir() -> Path:
     if os.name == "nt":
@@ -23,6 +18,28 @@ def _default_base_dir() -> Path:
     return Path("${HOME}/sources/workspaces")
 
 
+def _materialize_base_dir(raw: str) -> Path:
+    # Fast path for the default "${HOME}/..." form, no expandvars scan.
+    if raw.startswith("${HOME}/"):
+        home = os.environ.get("HOME")
+        if home:
+            return Path(home, raw[8:])
+    return Path(os.path.expandvars(raw)).expanduser()
+
+
+@lru_cache(maxsize=256)
+def _split_full_name(full_name: str) -> tuple[str, str]:
+    parts = full_name.split("/")
+    return parts[0], parts[1]
+
+
+@lru_cache(maxsize=256)
+def _repo_parent_path(base_dir: str, full_name: str) -> Path:
+    # base_dir is already materialized, see _LazyConfig.base_dir().
+    owner, name = _split_full_name(full_name)
+    return Path(os.path.join(base_dir, owner, name))
+
+
 @dataclass(slots=True)
 class GlobalsConfig:
     baseDir: Path = None
@@ -45,21 +62,21 @@ class RepoConfig:
         return self.full_name.replace("/", "-")
 
     def name_sanitized(self) -> str:
-        return self.full_name.split("/")[1].replace("/", "-")
+        return _split_full_name(self.full_name)[1]
 
     def owner(self) -> str:
-        return self.full_name.split("/")[0].replace("/", "-")
+        return _split_full_name(self.full_name)[0]
 
     def parent_path(self) -> Path:
-        return Path(os.path.expandvars(_config.globals.baseDir)) / self.owner() / self.name_sanitized()
+        return _repo_parent_path(_config.base_dir(), self.full_name)
 
     def main_git_path(self) -> Path:
-        return self.parent_path() / f"_{self.name_sanitized()}"
+        return Path(os.path.join(self.parent_path(), f"_{self.name_sanitized()}"))
 
     def worktree_path_for(self, branch: str) -> Path:
-        if branch in ["main", "master"]:
+        if branch in ("main", "master"):
             branch = self.defaultBranch
-        return self.parent_path() / f"{self.name_sanitized()}-{branch}"
+        return Path(os.path.join(self.parent_path(), f"{self.name_sanitized()}-{branch}"))
 
 
 @dataclass(slots=True)
@@ -116,47 +133,46 @@ class AppConfig:
         self.save()
 
 
-def from_dict(cls: Type[T], data: dict[str, Any]) -> T:
-    if not is_dataclass(cls):
-        raise TypeError(f"{cls!r} is not a dataclass")
+_GLOBALS_FIELDS = frozenset(f.name for f in fields(GlobalsConfig))
+_REPO_FIELDS = frozenset(f.name for f in fields(RepoConfig))
 
-    kwargs: dict[str, Any] = {}
 
-    for f in fields(cls):
-        if f.name not in data:
-            continue
+def _globals_from_dict(data: dict[str, Any]) -> GlobalsConfig:
+    kwargs = {k: v for k, v in data.items() if k in _GLOBALS_FIELDS}
+    base_dir = kwargs.get("baseDir")
+    if isinstance(base_dir, str):
+        kwargs["baseDir"] = Path(base_dir).expanduser()
+    return GlobalsConfig(**kwargs)
 
-        value = data[f.name]
-        field_type = f.type
-        origin = get_origin(field_type)
 
-        if is_dataclass(field_type) and isinstance(value, dict):
-            kwargs[f.name] = from_dict(field_type, value)
+def _repo_from_dict(data: dict[str, Any]) -> RepoConfig:
+    return RepoConfig(**{k: v for k, v in data.items() if k in _REPO_FIELDS})
 
-        elif origin is dict and isinstance(value, dict):
-            _, value_type = get_args(field_type)
-            if is_dataclass(value_type):
-                kwargs[f.name] = {
-                    k: from_dict(value_type, v)
-                    for k, v in value.items()
-                    if isinstance(v, dict)
-                }
-            else:
-                kwargs[f.name] = value
 
-        elif field_type is Path and isinstance(value, str):
-            kwargs[f.name] = Path(value).expanduser()
+def from_dict(data: dict[str, Any]) -> AppConfig:
+    config = AppConfig()
 
-        else:
-            kwargs[f.name] = value
+    globals_ = data.get("globals")
+    if isinstance(globals_, dict):
+        config.globals = _globals_from_dict(globals_)
+
+    workspaces = data.get("workspaces")
+    if isinstance(workspaces, dict):
+        config.workspaces = {
+            k: _repo_from_dict(v)
+            for k, v in workspaces.items()
+            if isinstance(v, dict)
+        }
 
-    return cls(**kwargs)
+    return config
 
 
 def to_dict(obj: Any) -> Any:
     return asdict(obj)
 
 
+# The environment does not change during a gitx run.
+@lru_cache(maxsize=1)
 def get_config_path() -> Path:
     if os.name == "nt":
         appdata = os.environ.get("APPDATA")
@@ -167,30 +183,84 @@ def get_config_path() -> Path:
     return base / CONFIG_DIR_NAME / CONFIG_FILE_NAME
 
 
+# orjson is an optional extra; failed imports are not cached by Python,
+# so look it up once.
+@lru_cache(maxsize=1)
+def _orjson() -> Any:
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _json_loads(data: bytes) -> Any:
+    orjson = _orjson()
+    if orjson is None:
+        return json.loads(data)
+    return orjson.loads(data)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    orjson = _orjson()
+    if orjson is None:
+        return json.dumps(obj, indent=2, default=str).encode("utf-8")
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+
+
+# mtime_ns is only part of the cache key: an edited file gets re-read.
+@lru_cache(maxsize=1)
+def load_raw_config(path: Path, mtime_ns: int) -> Optional[dict[str, Any]]:
+    try:
+        raw = _json_loads(path.read_bytes())
+    except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
+        return None
+    if not isinstance(raw, dict):
+        return None
+    return raw
+
+
 def load_config() -> AppConfig:
     path = get_config_path()
-    if not path.exists():
-        return AppConfig()
     try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
         return AppConfig()
-    if not isinstance(raw, dict):
+    raw = load_raw_config(path, mtime_ns)
+    if raw is None:
         return AppConfig()
-    return from_dict(AppConfig, raw)
+    return from_dict(raw)
 
 
 def save_config(config: AppConfig) -> None:
     path = get_config_path()
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(
-        json.dumps(to_dict(config), indent=2, default=str),
-        encoding="utf-8",
-    )
+    data = _json_dumps(to_dict(config))
+    # Write a uniquely named sibling file and rename it over the config, so
+    # readers never see a truncated document and concurrent saves never
+    # share a temp file. O_EXCL with mode 0o666 keeps the umask-derived
+    # permissions a plain write would give (mkstemp forces 0o600).
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.{os.urandom(4).hex()}.tmp")
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+    try:
+        fd = os.open(tmp_path, flags, 0o666)
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(tmp_path, flags, 0o666)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+    load_raw_config.cache_clear()
 
 
 def show_config() -> dict[str, Any]:
-    return to_dict(_config)
+    return to_dict(_config._load())
 
 
 def resolve_editor(editor: str) -> str:
@@ -199,6 +269,37 @@ def resolve_editor(editor: str) -> str:
     return editor
 
 
-# Load config once at module load time
-_config = load_config()
-_config.globals.baseDir = _default_base_dir()
\ No newline at end of file
+class _LazyConfig:
+    """Stands in for the AppConfig singleton; config.json is read on first use."""
+
+    __slots__ = ("_target", "_base_dir")
+
+    def __init__(self) -> None:
+        object.__setattr__(self, "_target", None)
+        object.__setattr__(self, "_base_dir", None)
+
+    def _load(self) -> AppConfig:
+        target = object.__getattribute__(self, "_target")
+        if target is None:
+            target = load_config()
+            target.globals.baseDir = _default_base_dir()
+            object.__setattr__(self, "_target", target)
+        return target
+
+    def base_dir(self) -> str:
+        """The expanded baseDir, resolved once per run; baseDir keeps the raw form for saving."""
+        base_dir = object.__getattribute__(self, "_base_dir")
+        if base_dir is None:
+            base_dir = os.fspath(_materialize_base_dir(os.fspath(self._load().globals.baseDir)))
+            object.__setattr__(self, "_base_dir", base_dir)
+        return base_dir
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._load(), name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        setattr(self._load(), name, value)
+
+
+# Loaded once, on first attribute access
+_config = _LazyConfig()
@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import functools
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+# Rich is only imported once something is actually printed.
+@functools.cache
+def get_console() -> Console:
+    from rich.console import Console
+
+    return Console()
@@ -1,28 +1,101 @@
+import errno
+import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
-from rich.console import Console
 
+VERBOSE = os.environ.get("GITX_VERBOSE") == "1"
+# Answers for confirmation prompts when stdin is not a terminal (scripts, CI).
+ASSUME_YES = os.environ.get("GITX_ASSUME_YES") == "1"
+ASSUME_NO = os.environ.get("GITX_ASSUME_NO") == "1"
 
-console = Console()
+# Environment for captured git queries, built once. They run without a
+# stdin, so git must not prompt, and they only read, so git may skip the
+# optional index lock instead of contending with a concurrent git process.
+_GIT_ENV = {**os.environ, "GIT_OPTIONAL_LOCKS": "0", "GIT_TERMINAL_PROMPT": "0"}
 
 
-def cmd(path: Path, *args: str) -> subprocess.CompletedProcess[str]:
+def _trace(args: tuple[str | os.PathLike[str], ...]) -> None:
+    sys.stderr.write(f"+ {' '.join(map(os.fspath, args))}\n")
+
+
+# gitx holds no file descriptors worth hiding from git, so close_fds=False
+# skips the per-spawn fd cleanup in the child.
+# git's progress and status lines (e.g. "Submodule path ...: checked out",
+# "HEAD is now at ...") go to stderr: stdout carries only what gitx prints,
+# such as the path read by `cd $(gitx go ...)`.
+def cmd(path: Path, *args: str | os.PathLike[str]) -> subprocess.CompletedProcess[str]:
+    if VERBOSE:
+        _trace(args)
     return subprocess.run(
         [*args],
-        cwd=str(path),
+        cwd=path,
+        close_fds=False,
         stdin=sys.stdin,
-        stdout=sys.stdout,
+        stdout=sys.stderr,
         stderr=sys.stderr,
     )
 
 
-def cmd_capture(path: Path, *args: str) -> subprocess.CompletedProcess[str]:
+def cmd_capture(path: Path, *args: str | os.PathLike[str]) -> subprocess.CompletedProcess[str]:
+    if VERBOSE:
+        _trace(args)
     return subprocess.run(
         [*args],
-        cwd=str(path),
+        cwd=path,
+        env=_GIT_ENV,
+        close_fds=False,
         stdin=subprocess.DEVNULL,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
         text=True,
     )
+
+
+def confirm(text: str, default: bool = False) -> bool:
+    """typer.confirm, answered by GITX_ASSUME_YES/GITX_ASSUME_NO when stdin is not a TTY."""
+    if (ASSUME_YES or ASSUME_NO) and not sys.stdin.isatty():
+        return ASSUME_YES
+
+    import typer
+
+    return typer.confirm(text, default=default)
+
+
+# Editors and file managers outlive gitx: start them in their own session
+# and return right away instead of waiting for them to exit.
+def launch(*args: str | os.PathLike[str]) -> subprocess.Popen[bytes]:
+    return subprocess.Popen(
+        [*args],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        start_new_session=True,
+    )
+
+
+# `rm -rf` unlinks a large object database noticeably faster than
+# shutil.rmtree; fall back to it where rm is not available.
+def remove_tree(path: Path) -> None:
+    if os.name == "nt":
+        shutil.rmtree(path)
+        return
+
+    if not os.path.lexists(path):
+        raise FileNotFoundError(errno.ENOENT, os.strerror(errno.ENOENT), os.fspath(path))
+
+    try:
+        res = subprocess.run(
+            ["rm", "-rf", "--", path],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+        )
+    except FileNotFoundError:
+        shutil.rmtree(path)
+        return
+
+    if res.returncode != 0:
+        raise OSError(res.stderr.strip() or f"rm exited with status {res.returncode}")
@@ -1,11 +1,17 @@
+import os
 import subprocess
+import sys
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Iterable, List, Optional
 
 from ..config import RepoConfig, _config
-from .paths import build_clone_url
-from .cli import cmd, cmd_capture
+from .paths import build_clone_url, parse_full_name, parse_host
+from .cli import VERBOSE, cmd, cmd_capture
+
+# Opt out of the local-branch shortcut in add_worktree() and always fetch.
+ALWAYS_FETCH = os.environ.get("GITX_ALWAYS_FETCH") == "1"
 
 
 # ===========================================================================
@@ -26,9 +32,12 @@ class WorktreeDoesNotExist(RuntimeError):
 
 
 class GitCommandFailed(RuntimeError):
-    def __init__(self, args: list[str], result: subprocess.CompletedProcess):
-        print(f"Git command failed ({result.returncode}): {' '.join(args)} {result}")
-        super().__init__(f"Git command failed ({result.returncode}): {' '.join(args)} {result.stdout} {result.stderr}")
+    def __init__(self, args: list[str | os.PathLike[str]], result: subprocess.CompletedProcess):
+        args = [os.fspath(arg) for arg in args]
+        command = " ".join(args)
+        if VERBOSE:
+            print(f"Git command failed ({result.returncode}): {command} {result}")
+        super().__init__(f"Git command failed ({result.returncode}): {command} {result.stdout} {result.stderr}")
         self.args = args
         self.code = result.returncode
 
@@ -37,6 +46,11 @@ class GitxError(RuntimeError):
     pass
 
 
+# stdout carries paths for `cd $(gitx go ...)`, so warnings go to stderr.
+def _warn(message: str) -> None:
+    sys.stderr.write(f"warning: {message}\n")
+
+
 # ===========================================================================
 # models
 # ===========================================================================
@@ -55,35 +69,66 @@ class BranchStatus:
 # primitives
 # ===========================================================================
 
+# One for-each-ref answers every existence check for a repo. Anything that
+# creates, fetches or deletes refs must call _load_refs.cache_clear().
+@lru_cache(maxsize=32)
+def _load_refs(repo_root: Path) -> frozenset[str]:
+    res = cmd_capture(
+        repo_root,
+        "git",
+        "for-each-ref",
+        "--format=%(refname)",
+        "refs/heads/",
+        "refs/remotes/origin/",
+    )
+    if res.returncode != 0:
+        return frozenset()
+    return frozenset(res.stdout.splitlines())
+
+
 def branch_exists(repo_root: Path, branch: str) -> bool:
-    local = cmd(repo_root, "git", "show-ref", "--verify", f"refs/heads/{branch}")
-    if local.returncode == 0:
-        return True
+    refs = _load_refs(repo_root)
+    return f"refs/heads/{branch}" in refs or f"refs/remotes/origin/{branch}" in refs
+
 
-    remote = cmd(repo_root, "git", "show-ref", "--verify", f"refs/remotes/origin/{branch}")
-    return remote.returncode == 0
+def _head_branch(head_file: Path) -> Optional[str]:
+    head = head_file.read_text(encoding="utf-8").strip()
+    if head.startswith("ref: refs/heads/"):
+        return head[len("ref: refs/heads/"):]
+    return None
 
 
 def iter_worktrees(repo: RepoConfig) -> Iterable[str]:
+    # Each worktree's HEAD lives in .git/worktrees/<name>/HEAD, reading those
+    # few files is much cheaper than spawning `git worktree list`.
+    git_dir = repo.main_git_path() / ".git"
+    try:
+        head_files = [git_dir / "HEAD"]
+        worktrees_dir = git_dir / "worktrees"
+        if worktrees_dir.is_dir():
+            head_files.extend(entry / "HEAD" for entry in worktrees_dir.iterdir())
+        branches = [_head_branch(head_file) for head_file in head_files]
+    except OSError:
+        return _iter_worktrees_porcelain(repo)
+
+    return [branch for branch in branches if branch is not None]
+
+
+def _iter_worktrees_porcelain(repo: RepoConfig) -> Iterable[str]:
     repo_root = repo.main_git_path()
     result = cmd_capture(repo_root, "git", "worktree", "list", "--porcelain")
     if result.returncode != 0 or not result.stdout:
         return []
 
     branches: list[str] = []
-    current_branch: Optional[str] = None
 
     for raw in result.stdout.splitlines():
         line = raw.strip()
 
-        if line.startswith("worktree "):
-            current_branch = None
-
-        elif line.startswith("branch "):
+        if line.startswith("branch "):
             ref = line.split(" ", 1)[1].strip()
             if ref.startswith("refs/heads/"):
-                current_branch = ref.split("/")[-1]
-                branches.append(current_branch)
+                branches.append(ref[len("refs/heads/"):])
 
     return branches
 
@@ -95,72 +140,141 @@ def iter_worktrees(repo: RepoConfig) -> Iterable[str]:
 def create_branch(repo: RepoConfig, branch: str) -> None:
     repo_root = repo.main_git_path()
 
-    res = cmd(repo_root, "git", "checkout", "-b", branch)
+    # `git branch` rather than `checkout -b`: the main clone has no working
+    # tree to switch, worktrees are added separately.
+    res = cmd(repo_root, "git", "branch", branch)
     if res.returncode != 0:
-        raise GitCommandFailed(["git", "checkout", "-b", branch], res)
+        raise GitCommandFailed(["git", "branch", branch], res)
 
     res = cmd(repo_root, "git", "push", "-u", "origin", branch)
+    _load_refs.cache_clear()
     if res.returncode != 0:
         raise GitCommandFailed(["git", "push", "-u", "origin", branch], res)
 
 
-def add_worktree(repo: RepoConfig, branch: str) -> None:
+def add_worktree(
+    repo: RepoConfig,
+    branch: str,
+    *,
+    fetch: bool = True,
+    checkout: bool = True,
+) -> None:
     repo_root = repo.main_git_path()
 
-    res = cmd(repo_root, "git", "fetch", "--all")
-    if res.returncode != 0:
-        raise GitCommandFailed(["git", "fetch", "--all"], res)
+    # A local branch can be checked out as is, only go to the remotes otherwise.
+    if fetch and (ALWAYS_FETCH or f"refs/heads/{branch}" not in _load_refs(repo_root)):
+        # Only the remote-tracking refs are read afterwards, FETCH_HEAD is not.
+        args = ["git", "fetch", "--all", "--no-write-fetch-head"]
+        res = cmd(repo_root, *args)
+        _load_refs.cache_clear()
+        if res.returncode != 0:
+            raise GitCommandFailed(args, res)
 
     if not branch_exists(repo_root, branch):
         raise BranchDoesNotExist(branch)
 
-    res = cmd(repo_root, "git", "checkout", "--detach")
+    # Detach HEAD without touching the (empty) working tree of the main clone,
+    # so the branch is free to be checked out in its own worktree.
+    res = cmd(repo_root, "git", "update-ref", "--no-deref", "HEAD", "HEAD")
+    if res.returncode != 0:
+        raise GitCommandFailed(["git", "update-ref", "--no-deref", "HEAD", "HEAD"], res)
+
+    worktree_path = repo.worktree_path_for(branch)
+    # --no-checkout only registers the worktree, for scripts that just need
+    # the path; files can be checked out later with `git reset --hard`.
+    args = ["git", "worktree", "add"]
+    if not checkout:
+        args.append("--no-checkout")
+    args += [worktree_path, branch]
+    res = cmd(repo_root, *args)
     if res.returncode != 0:
-        raise GitCommandFailed(["git", "checkout", "--detach"], res)
+        raise GitCommandFailed(args, res)
 
-    res = cmd(
-        repo_root,
-        "git",
-        "worktree",
-        "add",
-        str(repo.worktree_path_for(branch)),
-        branch,
-    )
+    if checkout:
+        init_submodules(worktree_path, repo_root / ".git")
+
+
+def _submodule_reference(common_dir: Path, submodule_path: str) -> Optional[Path]:
+    candidates = [common_dir / "modules" / submodule_path]
+    worktrees_dir = common_dir / "worktrees"
+    if worktrees_dir.is_dir():
+        candidates.extend(wt / "modules" / submodule_path for wt in worktrees_dir.iterdir())
+
+    for candidate in candidates:
+        if (candidate / "objects").is_dir():
+            return candidate
+    return None
+
+
+def init_submodules(worktree_path: Path, common_dir: Path) -> None:
+    """Initialize a new worktree's submodules, borrowing objects already on disk.
+
+    Submodules cloned for the main clone or another worktree are passed as
+    --reference, so only missing objects are downloaded. --dissociate copies
+    them in, so removing the other worktree later cannot break this one.
+
+    Failures (private or unreachable submodules) only print a warning: the
+    worktree itself is usable and stays in place.
+    """
+    if not (worktree_path / ".gitmodules").is_file():
+        return
+
+    res = cmd_capture(worktree_path, "git", "submodule", "status")
     if res.returncode != 0:
-        raise GitCommandFailed(
-            ["git", "worktree", "add", str(repo.worktree_path_for(branch)), branch],
-            res,
-        )
+        _warn(f"cannot list submodules in {worktree_path}: {res.stderr.strip()}")
+        return
+
+    for line in res.stdout.splitlines():
+        # "-<sha> <path>" marks a submodule that is not initialized yet
+        if not line.startswith("-"):
+            continue
+        submodule_path = line[1:].split(" ", 1)[1]
+        if submodule_path.endswith(")") and " (" in submodule_path:
+            submodule_path = submodule_path.rsplit(" (", 1)[0]
+
+        args = ["git", "submodule", "update", "--init"]
+        reference = _submodule_reference(common_dir, submodule_path)
+        if reference is not None:
+            args += ["--reference", reference, "--dissociate"]
+        args += ["--", submodule_path]
+
+        res = cmd(worktree_path, *args)
+        if res.returncode != 0:
+            _warn(f"submodule '{submodule_path}' was not initialized (git exited with {res.returncode})")
 
 
 def delete_branch(repo: RepoConfig, branch: str, *, delete_remote: bool = False) -> None:
     repo_root = repo.main_git_path()
 
-    local = cmd(repo_root, "git", "show-ref", "--verify", f"refs/heads/{branch}")
-    remote = cmd(repo_root, "git", "show-ref", "--verify", f"refs/remotes/origin/{branch}")
+    refs = _load_refs(repo_root)
+    has_local = f"refs/heads/{branch}" in refs
+    has_remote = f"refs/remotes/origin/{branch}" in refs
 
     # No local branch and remote deletion not requested: behave as before
-    if local.returncode != 0 and not delete_remote:
+    if not has_local and not delete_remote:
         raise BranchDoesNotExist(branch)
 
     # If a local branch exists, clean up worktree and local ref
-    if local.returncode == 0:
+    if has_local:
         wt_path = repo.worktree_path_for(branch)
         if wt_path.exists():
-            res = cmd(repo_root, "git", "worktree", "remove", str(wt_path))
+            args = ["git", "worktree", "remove", wt_path]
+            res = cmd(repo_root, *args)
             if res.returncode != 0:
-                raise GitCommandFailed(["git", "worktree", "remove", str(wt_path)], res)
+                raise GitCommandFailed(args, res)
 
         res = cmd(repo_root, "git", "branch", "-d", branch)
+        _load_refs.cache_clear()
         if res.returncode != 0:
             raise GitCommandFailed(["git", "branch", "-d", branch], res)
 
     # Optionally delete the remote branch, even if there is no local one
     if delete_remote:
-        if remote.returncode != 0:
+        if not has_remote:
             raise BranchDoesNotExist(branch)
 
         res = cmd(repo_root, "git", "push", "origin", "--delete", branch)
+        _load_refs.cache_clear()
         if res.returncode != 0:
             raise GitCommandFailed(["git", "push", "origin", "--delete", branch], res)
 
@@ -255,11 +369,49 @@ def list_branches_with_status(repo: RepoConfig) -> List[BranchStatus]:
 # clone
 # ===========================================================================
 
+def _ref_objects(git_dir: Path) -> set[str]:
+    res = cmd_capture(git_dir, "git", "for-each-ref", "--format=%(objectname)")
+    if res.returncode != 0:
+        return set()
+    return set(res.stdout.split())
+
+
+def _clone_reference(repo_cfg: RepoConfig) -> Optional[Path]:
+    # Forks share a name and most of their history; an already cloned one
+    # can lend its objects to the new clone. Same-named but unrelated repos
+    # (docs, api, ...) are common and would only cost a full repack for
+    # --dissociate, so a candidate must share a ref tip or tag with the
+    # remote before it is used.
+    name = repo_cfg.name_sanitized()
+    host = parse_host(repo_cfg.url)
+    candidates = []
+    for ws in _config.workspaces.values():
+        if ws.full_name == repo_cfg.full_name or ws.name_sanitized() != name:
+            continue
+        if parse_host(ws.url) != host:
+            continue
+        git_dir = ws.main_git_path() / ".git"
+        if (git_dir / "objects").is_dir():
+            candidates.append(git_dir)
+    if not candidates:
+        return None
+
+    res = cmd_capture(candidates[0], "git", "ls-remote", repo_cfg.url)
+    if res.returncode != 0:
+        return None
+    remote_objects = {line.split("\t", 1)[0] for line in res.stdout.splitlines()}
+
+    for git_dir in candidates:
+        if not remote_objects.isdisjoint(_ref_objects(git_dir)):
+            return git_dir
+    return None
+
+
 def clone_and_add_worktree(target: str) -> RepoConfig:
     url = build_clone_url(target, _config.globals.defaultProvider)
 
     repo_cfg = RepoConfig(
-        full_name=target,
+        full_name=parse_full_name(target),
         url=url,
         lastBranch="",
         defaultBranch="",
@@ -268,26 +420,32 @@ def clone_and_add_worktree(target: str) -> RepoConfig:
     repo_root = repo_cfg.main_git_path()
     repo_root.parent.mkdir(parents=True, exist_ok=True)
 
-    res = cmd(repo_root.parent, "git", "clone", url, str(repo_root))
+    # Files are only ever checked out in worktrees, never in the main clone.
+    args = ["git", "clone", "--no-checkout"]
+    reference = _clone_reference(repo_cfg)
+    if reference is not None:
+        # --dissociate: deleting the other repository later must not break this one.
+        args += ["--reference", reference, "--dissociate"]
+    args += [url, repo_root]
+    res = cmd(repo_root.parent, *args)
     if res.returncode != 0:
-        raise GitCommandFailed(["git", "clone", url], res)
+        raise GitCommandFailed(args, res)
 
-    res = cmd(repo_root, "git", "checkout", "--detach")
-    if res.returncode != 0:
-        raise GitCommandFailed(["git", "checkout", "--detach"], res)
-
-    head = cmd(repo_root, "git", "symbolic-ref", "refs/remotes/origin/HEAD")
+    head = cmd_capture(repo_root, "git", "symbolic-ref", "refs/remotes/origin/HEAD")
     if head.returncode == 0 and head.stdout:
         default = head.stdout.strip().split("/")[-1]
     else:
         for c in ("main", "master"):
-            if cmd(repo_root, "git", "rev-parse", "--verify", f"origin/{c}").returncode == 0:
+            if f"refs/remotes/origin/{c}" in _load_refs(repo_root):
                 default = c
                 break
         else:
             raise GitxError("Cannot determine default branch")
 
-    add_worktree(repo_cfg, default)
+    # worktree_path_for() maps main/master to defaultBranch, so set it first.
     repo_cfg.defaultBranch = default
 
+    # The clone is fresh: no need to fetch again before adding the worktree.
+    add_worktree(repo_cfg, default, fetch=False)
+
     return repo_cfg
\ No newline at end of file
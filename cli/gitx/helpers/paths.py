@@ -1,11 +1,30 @@
+import os
+import re
 from pathlib import Path
-from typing import Tuple
+from typing import Optional, Tuple
 
 from ..config import AppConfig
 
+_GIT_URL_PREFIXES = ("https://", "git://", "git@")
+_GIT_URL_RE = re.compile(r"^(?:git@|(?:https|git)://)([^:/]+)[:/]([^/]+)/([^/]+?)(?:\.git)?/?$")
+
 
 def _is_full_git_url(target: str) -> bool:
-    return target.startswith("https://") or target.startswith("git://") or target.startswith("git@")
+    return target.startswith(_GIT_URL_PREFIXES)
+
+
+def parse_full_name(target: str) -> str:
+    match = _GIT_URL_RE.match(target)
+    if match is None:
+        return target
+    return f"{match.group(2)}/{match.group(3)}"
+
+
+def parse_host(url: str) -> Optional[str]:
+    match = _GIT_URL_RE.match(url)
+    if match is None:
+        return None
+    return match.group(1)
 
 
 def build_clone_url(target: str, provider: str) -> str:
@@ -30,6 +49,5 @@ def build_clone_paths(target: str, cfg: AppConfig) -> Tuple[Path, Path]:
         raise ValueError(msg)
 
     org, repo = target.split("/", 1)
-    repo_root = cfg.globals.baseDir / org / repo / repo
-    main_worktree = cfg.globals.baseDir / org / repo / f"{repo}-main"
-    return repo_root, main_worktree
+    parent = os.path.join(cfg.globals.baseDir, org, repo)
+    return Path(os.path.join(parent, repo)), Path(os.path.join(parent, f"{repo}-main"))
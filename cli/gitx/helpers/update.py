@@ -4,15 +4,13 @@ import json
 import subprocess
 import time
 from importlib import metadata as importlib_metadata
-from typing import Optional
-from urllib.error import HTTPError, URLError
-from urllib.request import urlopen
-
-import typer
-from rich.console import Console
+from typing import TYPE_CHECKING, Optional
 
 from ..config import _config
 
+if TYPE_CHECKING:
+    from rich.console import Console
+
 PACKAGE_NAME = "gitx-cli"
 PYPI_URL = f"https://pypi.org/pypi/{PACKAGE_NAME}/json"
 CHECK_INTERVAL_SECONDS = 60 * 60 * 24  # 24 hours
@@ -28,6 +26,9 @@ def _get_current_version() -> Optional[str]:
 
 
 def _get_latest_version(timeout: float = 2.0) -> Optional[str]:
+    from urllib.error import HTTPError, URLError
+    from urllib.request import urlopen
+
     try:
         with urlopen(PYPI_URL, timeout=timeout) as response:  # type: ignore[call-arg]
             if response.status != 200:
@@ -119,6 +120,10 @@ def maybe_check_for_update(console: Console) -> None:
         f"[yellow]A new gitx-cli version is available: {current} -> {latest}[/]"
     )
 
+    import typer
+
+    # Not helpers.cli.confirm: GITX_ASSUME_YES answers workflow prompts and
+    # must never upgrade gitx itself.
     if not typer.confirm("Upgrade gitx-cli using pipx now?", default=False):
         return
 
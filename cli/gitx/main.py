@@ -1,9 +1,62 @@
-"""gitx Typer entrypoint.
+"""gitx entrypoint.
 
-This module exposes the Typer app as `app` for use in console scripts.
+`main` is the console script. It answers the common `gitx go <repo>` case
+directly and only builds the Typer app (exposed lazily as `app`) otherwise.
 """
 
+import os
+import sys
+import time
+from typing import Any, Optional
 
-from .cli import app
+__all__ = ["app", "main"]
 
-__all__ = ["app"]
+
+def _fast_go(argv: list[str]) -> Optional[str]:
+    """Resolve `gitx go <repo>` without Typer.
+
+    Returns the worktree path, or None whenever the full CLI is needed:
+    options, unknown repo, missing worktree (prompts) or a due update check.
+    """
+    if len(argv) != 2 or argv[0] != "go" or argv[1].startswith("-"):
+        return None
+
+    from .config import _config
+    from .helpers import git
+    from .helpers.update import _should_check_for_update
+
+    if _should_check_for_update(time.time()):
+        return None
+
+    repo_cfg = _config.resolve_workspace(argv[1])
+    if repo_cfg is None:
+        return None
+
+    branch = repo_cfg.lastBranch or repo_cfg.defaultBranch
+    if branch not in git.iter_worktrees(repo_cfg):
+        return None
+
+    if repo_cfg.lastBranch != branch:
+        repo_cfg.lastBranch = branch
+        _config.save()
+
+    return os.fspath(repo_cfg.worktree_path_for(branch))
+
+
+def main() -> None:
+    path = _fast_go(sys.argv[1:])
+    if path is not None:
+        print(path)
+        return
+
+    from .cli import build_app
+
+    build_app(sys.argv[1:])()
+
+
+def __getattr__(name: str) -> Any:
+    if name == "app":
+        from .cli import app
+
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")